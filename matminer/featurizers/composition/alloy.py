@@ -778,11 +778,12 @@ class WenAlloys(BaseFeaturizer):
             (float) local mismatch
         """
 
-        array_variable = np.array(variable)
-        array_fractions = np.array(fractions)
-        variable_upper_triangle = abs((array_variable[:, None] - array_variable)[np.triu_indices(len(variable), k=1)])
-        fractions_upper_triangle = (array_fractions[:, None] * array_fractions)[np.triu_indices(len(fractions), k=1)]
-        return sum(variable_upper_triangle * fractions_upper_triangle)
+        array_variable = np.asarray(variable)
+        array_fractions = np.asarray(fractions)
+        first, second = np.triu_indices(len(variable), k=1)
+        variable_upper_triangle = np.abs(array_variable[first] - array_variable[second])
+        fractions_upper_triangle = array_fractions[first] * array_fractions[second]
+        return np.dot(variable_upper_triangle, fractions_upper_triangle)
 
     @staticmethod
     def compute_delta(variable, fractions):
@@ -921,7 +922,7 @@ class WenAlloys(BaseFeaturizer):
         modulus_combination = (
             2 * array_fractions * (array_shear - mean_shear_modulus) / (array_shear + mean_shear_modulus)
         )
-        return sum(modulus_combination / (1 + 0.5 * abs(modulus_combination)))
+        return np.sum(modulus_combination / (1 + 0.5 * np.abs(modulus_combination)))
 
     def compute_magpie_summary(self, attribute_name, elements, fractions):
         """Get limited list of weighted statistics according to magpie data.
@@ -952,14 +953,11 @@ class WenAlloys(BaseFeaturizer):
         Returns:
             (float) H_mixing
         """
+        elements = [Element(e) for e in elements]
         enthalpy = 0
         for i, e1 in enumerate(elements):
             for j, e2 in enumerate(elements[:i]):
-                enthalpy += (
-                    fractions[i]
-                    * fractions[j]
-                    * self.data_source_enthalpy.get_mixing_enthalpy(Element(e1), Element(e2))
-                )
+                enthalpy += fractions[i] * fractions[j] * self.data_source_enthalpy.get_mixing_enthalpy(e1, e2)
         enthalpy *= 4
         # Make sure the enthalpy is nonzero
         #  The limit as dH->0 of omega is +\inf. A very small positive dH will approximate
@@ -4,6 +4,8 @@ Composition featurizers for composite features containing more than 1 category o
 
 import warnings
 
+import numpy as np
+
 from matminer.featurizers.base import BaseFeaturizer
 from matminer.featurizers.composition.element import ElementFraction
 from matminer.featurizers.composition.orbital import ValenceOrbital
@@ -82,6 +84,8 @@ class ElementProperty(BaseFeaturizer):
         self.stats = stats
         # Initialize stats computer
         self.pstats = PropertyStats()
+        # Featurizing is fast, so send larger batches of entries to each worker
+        self._chunksize = 30
 
     @classmethod
     def from_preset(cls, preset_name, impute_nan=False):
@@ -206,10 +210,21 @@ class ElementProperty(BaseFeaturizer):
 
         # Get the element names and fractions
         elements, fractions = zip(*comp.element_composition.items())
+        fractions = np.array(fractions)
 
-        for attr in self.features:
-            elem_data = [self.data_source.get_elemental_property(e, attr) for e in elements]
+        all_elem_data = [self.data_source.get_elemental_properties(elements, attr) for attr in self.features]
+
+        # Compute all statistics for all properties in one pass, if possible
+        if self.features and PropertyStats.matrix_stats.issuperset(self.stats):
+            try:
+                data_matrix = np.array(all_elem_data)
+            except ValueError:
+                # Sequence-valued properties of different lengths
+                data_matrix = None
+            if data_matrix is not None and data_matrix.ndim == 2 and np.issubdtype(data_matrix.dtype, np.number):
+                return PropertyStats.calc_stats_matrix(data_matrix, self.stats, fractions).flatten().tolist()
 
+        for elem_data in all_elem_data:
             for stat in self.stats:
                 all_attributes.append(self.pstats.calc_stat(elem_data, stat, fractions))
 
@@ -348,6 +363,12 @@ class Meredig(BaseFeaturizer):
         ]
         # Initialize stats computer
         self.pstats = PropertyStats()
+        # Initialize the featurizers for element fractions and valence orbitals
+        self._element_fraction = ElementFraction()
+        self._valence_orbital = ValenceOrbital(
+            orbitals=("s", "p", "d", "f"), props=("avg", "frac"), impute_nan=self.impute_nan
+        )
+        self._chunksize = 30
 
     def featurize(self, comp):
         """
@@ -361,7 +382,7 @@ class Meredig(BaseFeaturizer):
         """
 
         # First 103 features are element fractions, we can get these from the ElementFraction featurizer
-        element_fraction_features = ElementFraction().featurize(comp)
+        element_fraction_features = self._element_fraction.featurize(comp)
 
         # Next 9 features are statistics on elemental properties
         elements, fractions = zip(*comp.element_composition.items())
@@ -371,20 +392,18 @@ class Meredig(BaseFeaturizer):
             stat = feat.split(" ")[0]
             attr = " ".join(feat.split(" ")[1:])
 
-            elem_data = [self.data_source.get_elemental_property(e, attr) for e in elements]
+            elem_data = self.data_source.get_elemental_properties(elements, attr)
             element_property_features[i] = self.pstats.calc_stat(elem_data, stat, fractions)
 
         # Final 8 features are statistics on valence orbitals, available from the ValenceOrbital featurizer
-        valence_orbital_features = ValenceOrbital(
-            orbitals=("s", "p", "d", "f"), props=("avg", "frac"), impute_nan=self.impute_nan
-        ).featurize(comp)
+        valence_orbital_features = self._valence_orbital.featurize(comp)
 
         return element_fraction_features + element_property_features + valence_orbital_features
 
     def feature_labels(self):
         # Since we have more features than just element fractions, append 'fraction' to element symbols for clarity
-        element_fraction_features = [e + " fraction" for e in ElementFraction().feature_labels()]
-        valence_orbital_features = ValenceOrbital(impute_nan=self.impute_nan).feature_labels()
+        element_fraction_features = [e + " fraction" for e in self._element_fraction.feature_labels()]
+        valence_orbital_features = self._valence_orbital.feature_labels()
         return element_fraction_features + self._element_property_feature_labels + valence_orbital_features
 
     def citations(self):
@@ -4,12 +4,18 @@ Composition featurizers for elemental data and stoichiometry.
 
 import warnings
 
+import numpy as np
 from pymatgen.core import Element
 
 from matminer.featurizers.base import BaseFeaturizer
+from matminer.featurizers.utils.stats import PropertyStats
 from matminer.utils.data import DemlData, MagpieData
 from matminer.utils.warnings import IMPUTE_NAN_WARNING
 
+# Element symbols in order of atomic number. Element.from_Z scans the whole
+#  periodic table for each lookup, so build this list once
+_ELEMENT_SYMBOLS = [Element.from_Z(z).symbol for z in range(1, 118 + 1)]
+
 
 class ElementFraction(BaseFeaturizer):
     """
@@ -39,10 +45,7 @@ class ElementFraction(BaseFeaturizer):
         return vector
 
     def feature_labels(self):
-        labels = []
-        for i in range(1, 119):
-            labels.append(Element.from_Z(i).symbol)
-        return labels
+        return list(_ELEMENT_SYMBOLS)
 
     def implementors(self):
         return ["Ashwin Aggarwal", "Logan Ward"]
@@ -151,24 +154,24 @@ class Stoichiometry(BaseFeaturizer):
 
         el_amt = comp.get_el_amt_dict()
 
-        # Compute the number of atoms per formula unit
-        n_atoms_per_unit = comp.num_atoms / comp.get_integer_formula_and_factor()[1]
+        # Compute the number of atoms per formula unit, only if needed (it requires reducing the formula)
+        if self.p_list is None or self.num_atoms:
+            n_atoms_per_unit = comp.num_atoms / comp.get_integer_formula_and_factor()[1]
 
         if self.p_list is None:
             stoich_attr = [n_atoms_per_unit]  # return num atoms if no norms specified
         else:
             p_norms = [0] * len(self.p_list)
-            n_atoms = sum(el_amt.values())
+            amounts = np.array(list(el_amt.values()))
+            fractions = amounts / amounts.sum()
 
-            for i in range(len(self.p_list)):
-                if self.p_list[i] < 0:
+            for i, p in enumerate(self.p_list):
+                if p < 0:
                     raise ValueError("p-norm not defined for p < 0")
-                if self.p_list[i] == 0:
-                    p_norms[i] = len(el_amt.values())
+                if p == 0:
+                    p_norms[i] = len(fractions)
                 else:
-                    for j in el_amt:
-                        p_norms[i] += (el_amt[j] / n_atoms) ** self.p_list[i]
-                    p_norms[i] = p_norms[i] ** (1.0 / self.p_list[i])
+                    p_norms[i] = np.sum(fractions**p) ** (1.0 / p)
 
             if self.num_atoms:
                 stoich_attr = [n_atoms_per_unit] + p_norms
@@ -216,6 +219,7 @@ class BandCenter(BaseFeaturizer):
             warnings.warn(f"{self.__class__.__name__}(impute_nan=False):\n" + IMPUTE_NAN_WARNING)
         self.magpie_data = MagpieData(impute_nan=self.impute_nan)
         self.deml_data = DemlData(impute_nan=self.impute_nan)
+        self._chunksize = 30
 
     def featurize(self, comp):
         """
@@ -229,13 +233,11 @@ class BandCenter(BaseFeaturizer):
             (float) band center.
 
         """
-        gmean = 1.0
-        sumamt = sum(comp.get_el_amt_dict().values())
-        for el, amt in comp.get_el_amt_dict().items():
-            first_ioniz = self.deml_data.get_elemental_property(Element(el), "first_ioniz") / 1000
-            elec_aff = self.magpie_data.get_elemental_property(Element(el), "ElectronAffinity")
-            gmean *= (0.5 * (first_ioniz + elec_aff) / 96.48) ** (amt / sumamt)
-        return [gmean]
+        elements, amounts = zip(*comp.element_composition.items())
+        first_ioniz = self.deml_data.get_elemental_properties(elements, "first_ioniz") / 1000
+        elec_aff = self.magpie_data.get_elemental_properties(elements, "ElectronAffinity")
+        electronegativity = 0.5 * (first_ioniz + elec_aff) / 96.48
+        return [PropertyStats.holder_mean(electronegativity, amounts, power=0)]
 
     def feature_labels(self):
         return ["band center"]
@@ -68,9 +68,6 @@ class CationProperty(ElementProperty):
         # Prepare to store the attributes
         all_attributes = []
 
-        # Initialize stats computer
-        pstats = PropertyStats()
-
         # Get the cation species and fractions
         cations, fractions = zip(*((s, f) for s, f in comp.items() if s.oxi_state > 0))
 
@@ -78,7 +75,7 @@ class CationProperty(ElementProperty):
             elem_data = [self.data_source.get_charge_dependent_property_from_specie(c, attr) for c in cations]
 
             for stat in self.stats:
-                all_attributes.append(pstats.calc_stat(elem_data, stat, fractions))
+                all_attributes.append(self.pstats.calc_stat(elem_data, stat, fractions))
 
         return all_attributes
 
@@ -204,19 +201,12 @@ class IonProperty(BaseFeaturizer):
                     oxi_state_dict = dict(zip([e.symbol for e in elements], oxidation_states))
                     cpd_possible = len(comp.oxi_state_guesses(oxi_states_override=oxi_state_dict)) > 0
 
-            # Ionic character attributes
-            atom_pairs = itertools.combinations(range(len(elements)), 2)
-            el_frac = list(np.true_divide(fractions, sum(fractions)))
-
-            ionic_char = []
-            avg_ionic_char = 0
-
-            for pair in atom_pairs:
-                XA = elec[pair[0]]
-                XB = elec[pair[1]]
-                ionic_char.append(1.0 - np.exp(-0.25 * ((XA - XB) ** 2)))
-                avg_ionic_char += el_frac[pair[0]] * el_frac[pair[1]] * ionic_char[-1]
+            # Ionic character attributes, computed for all pairs of elements at once
+            first, second = np.triu_indices(len(elements), 1)
+            el_frac = np.true_divide(fractions, sum(fractions))
 
+            ionic_char = 1.0 - np.exp(-0.25 * (elec[first] - elec[second]) ** 2)
+            avg_ionic_char = np.dot(el_frac[first] * el_frac[second], ionic_char)
             max_ionic_char = np.max(ionic_char)
 
         return [cpd_possible, max_ionic_char, avg_ionic_char]
@@ -5,11 +5,11 @@ Composition featurizers for orbital data.
 import collections
 from warnings import warn
 
+import numpy as np
 from pymatgen.core.composition import Composition
 from pymatgen.core.molecular_orbitals import MolecularOrbitals
 
 from matminer.featurizers.base import BaseFeaturizer
-from matminer.featurizers.utils.stats import PropertyStats
 from matminer.utils.data import MagpieData
 from matminer.utils.warnings import IMPUTE_NAN_WARNING
 
@@ -52,7 +52,7 @@ class AtomicOrbitals(BaseFeaturizer):
         integer_comp, factor = comp.get_integer_formula_and_factor()
 
         # warning message if composition is dilute and truncated
-        if not len(Composition(comp).elements) == len(Composition(integer_comp).elements):
+        if not len(comp.elements) == len(Composition(integer_comp).elements):
             warn(f"AtomicOrbitals: {comp} truncated to {integer_comp}")
 
         homo_lumo = MolecularOrbitals(integer_comp).band_edges
@@ -116,6 +116,7 @@ class ValenceOrbital(BaseFeaturizer):
         self.data_source = MagpieData(impute_nan=self.impute_nan)
         self.orbitals = orbitals
         self.props = props
+        self._chunksize = 30
 
     def featurize(self, comp):
         """Weighted fraction of valence electrons in each orbital
@@ -130,22 +131,19 @@ class ValenceOrbital(BaseFeaturizer):
 
         elements, fractions = zip(*comp.element_composition.items())
 
+        # Get the number of electrons in each shell, and the total, for all elements at once
+        valence = np.array(
+            [self.data_source.get_elemental_properties(elements, f"N{orb}Valence") for orb in self.orbitals]
+            + [self.data_source.get_elemental_properties(elements, "NValence")]
+        )
+
         # Get the mean number of electrons in each shell
-        avg = [
-            PropertyStats.mean(
-                self.data_source.get_elemental_properties(elements, f"N{orb}Valence"),
-                weights=fractions,
-            )
-            for orb in self.orbitals
-        ]
+        mean_valence = np.dot(valence, fractions) / np.sum(fractions)
+        avg = list(mean_valence[:-1])
 
         # If needed, get fraction of electrons in each shell
         if "frac" in self.props:
-            avg_total_valence = PropertyStats.mean(
-                self.data_source.get_elemental_properties(elements, "NValence"),
-                weights=fractions,
-            )
-            frac = [a / avg_total_valence for a in avg]
+            frac = list(mean_valence[:-1] / mean_valence[-1])
 
         # Get the desired attributes
         valence_attributes = []
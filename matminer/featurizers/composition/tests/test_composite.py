@@ -1,8 +1,11 @@
 import math
 import unittest
 
+from pymatgen.core import Composition, Element
+
 from matminer.featurizers.composition.composite import ElementProperty, Meredig
 from matminer.featurizers.composition.tests.base import CompositionFeaturesTest
+from matminer.featurizers.utils.stats import PropertyStats
 
 
 class CompositeFeaturesTest(CompositionFeaturesTest):
@@ -44,6 +47,30 @@ class CompositeFeaturesTest(CompositionFeaturesTest):
         self.assertAlmostEqual(df_elem["MagpieData mode Number"][0], 56.5)
         self.assertEqual(df_elem.isna().sum().sum(), 0)
 
+    def test_elem_fallback(self):
+        # No features
+        self.assertEqual(ElementProperty("magpie", [], ["mean"]).featurize(Composition("Fe2O3")), [])
+
+        # Sequence-valued properties are not computed in a single pass, but stat by stat
+        ep = ElementProperty("magpie", ["OxidationStates"], ["minimum", "maximum"])
+        comp = Composition("FeCu")
+        elem_data = ep.data_source.get_elemental_properties([Element("Fe"), Element("Cu")], "OxidationStates")
+        expected = [PropertyStats.calc_stat(elem_data, stat, [0.5, 0.5]) for stat in ep.stats]
+        self.assertEqual(ep.featurize(comp), expected)
+
+    def test_elem_pure(self):
+        # Geometric statistics of a single element: the mean is exact, and the deviation is undefined
+        ep = ElementProperty("magpie", ["Number", "MeltingT"], ["holder_mean::0", "geom_std_dev"])
+        for comp, number, melting_t in [("Fe", 26, 1811), ("Cu", 29, 1357.77), ("C", 6, 3823)]:
+            self.assertEqual(PropertyStats.holder_mean([number], [1], power=0), number)
+            self.assertEqual(PropertyStats.holder_mean([melting_t], [1], power=0), melting_t)
+
+            features = ep.featurize(Composition(comp))
+            self.assertEqual(features[0], number)
+            self.assertEqual(features[2], melting_t)
+            self.assertTrue(math.isnan(features[1]))
+            self.assertTrue(math.isnan(features[3]))
+
     def test_elem_deml(self):
         df_elem_deml = ElementProperty.from_preset("deml", impute_nan=False).featurize_dataframe(
             self.df, col_id="composition"
@@ -1,6 +1,8 @@
+import pickle
 import unittest
 from unittest import SkipTest
 
+from pymatgen.core import Composition
 from pymatgen.ext.matproj import MPRester, MPRestError
 
 from matminer.featurizers.composition.tests.base import CompositionFeaturesTest
@@ -20,6 +22,17 @@ class ThermoFeaturesTest(CompositionFeaturesTest):
         df_cohesive_energy = CohesiveEnergy().featurize_dataframe(self.df, col_id="composition")
         self.assertAlmostEqual(df_cohesive_energy["cohesive energy"][0], 5.179358342, 2)
 
+    def test_cohesive_energy_from_formation_energy(self):
+        # Fe: 4.28 eV/atom, O: 2.60 eV/atom (Kittel)
+        ce = CohesiveEnergy().featurize(Composition("Fe2O3"), formation_energy_per_atom=-1.5)
+        self.assertAlmostEqual(ce[0], (2 * 4.28 + 3 * 2.60) / 5 + 1.5, 6)
+
+    def test_mprester_not_pickled(self):
+        # Copies of the featurizer (e.g., for worker processes) must not share the client's session
+        for featurizer in [CohesiveEnergy(), CohesiveEnergyMP()]:
+            featurizer._mpr = object()
+            self.assertIsNone(pickle.loads(pickle.dumps(featurizer))._mpr)
+
     def test_cohesive_energy_mp(self):
         raise SkipTest("Unable to debug issues with this test without a legacy MP key. Skipping for now.")
         try:
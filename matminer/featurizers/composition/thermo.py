@@ -2,12 +2,38 @@
 Composition featurizers for thermodynamic properties.
 """
 
+import numpy as np
 
 from matminer.featurizers.base import BaseFeaturizer
 from matminer.utils.data import CohesiveEnergyData
 
 
-class CohesiveEnergy(BaseFeaturizer):
+class _MPResterMixin:
+    """Gives a featurizer its own MPRester client, so that a new session is not opened for every composition
+
+    The client is created on first use from the ``mapi_key`` attribute and is not pickled, so copies of the
+    featurizer (e.g., in the worker processes of ``featurize_many``) open their own session.
+    """
+
+    def _get_mprester(self):
+        """Get the MPRester client of this featurizer, creating it if needed
+
+        Returns:
+            (MPRester) client for the Materials Project API
+        """
+        if getattr(self, "_mpr", None) is None:
+            from pymatgen.ext.matproj import MPRester
+
+            self._mpr = MPRester(self.mapi_key) if self.mapi_key else MPRester()
+        return self._mpr
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_mpr"] = None
+        return state
+
+
+class CohesiveEnergy(_MPResterMixin, BaseFeaturizer):
     """
     Cohesive energy per atom using elemental cohesive energies and
     formation energy.
@@ -24,6 +50,8 @@ class CohesiveEnergy(BaseFeaturizer):
 
     def __init__(self, mapi_key=None):
         self.mapi_key = mapi_key
+        self.data_source = CohesiveEnergyData()
+        self._mpr = None
 
     def featurize(self, comp, formation_energy_per_atom=None):
         """
@@ -39,26 +67,22 @@ class CohesiveEnergy(BaseFeaturizer):
         formation_energy_per_atom = formation_energy_per_atom or None
 
         if not formation_energy_per_atom:
-            from pymatgen.ext.matproj import MPRester
-
             # Get formation energy of most stable structure from MP
-            if self.mapi_key:
-                struct_lst = MPRester(self.mapi_key).get_data(comp.reduced_formula)
-            else:
-                struct_lst = MPRester().get_data(comp.reduced_formula)
+            struct_lst = self._get_mprester().get_data(comp.reduced_formula)
 
             if len(struct_lst) > 0:
-                most_stable_entry = sorted(struct_lst, key=lambda e: e["energy_per_atom"])[0]
+                most_stable_entry = min(struct_lst, key=lambda e: e["energy_per_atom"])
                 formation_energy_per_atom = most_stable_entry["formation_energy_per_atom"]
             else:
                 raise ValueError(f"No structure found in MP for {comp}")
 
         # Subtract elemental cohesive energies from formation energy
-        cohesive_energy = -formation_energy_per_atom * comp.num_atoms
-        for el in el_amt_dict:
-            cohesive_energy += el_amt_dict[el] * CohesiveEnergyData().get_elemental_property(el)
+        num_atoms = comp.num_atoms
+        cohesive_energy = -formation_energy_per_atom * num_atoms
+        el_cohesive_energies = [self.data_source.get_elemental_property(el) for el in el_amt_dict]
+        cohesive_energy += np.dot(list(el_amt_dict.values()), el_cohesive_energies)
 
-        cohesive_energy_per_atom = cohesive_energy / comp.num_atoms
+        cohesive_energy_per_atom = cohesive_energy / num_atoms
 
         return [cohesive_energy_per_atom]
 
@@ -81,7 +105,7 @@ class CohesiveEnergy(BaseFeaturizer):
         ]
 
 
-class CohesiveEnergyMP(BaseFeaturizer):
+class CohesiveEnergyMP(_MPResterMixin, BaseFeaturizer):
     """
     Cohesive energy per atom lookup using Materials Project
 
@@ -92,6 +116,7 @@ class CohesiveEnergyMP(BaseFeaturizer):
 
     def __init__(self, mapi_key=None):
         self.mapi_key = mapi_key
+        self._mpr = None
 
     def featurize(self, comp):
         """
@@ -99,23 +124,19 @@ class CohesiveEnergyMP(BaseFeaturizer):
         Args:
             comp: (str) compound composition, eg: "NaCl"
         """
-        from pymatgen.ext.matproj import MPRester
-
         # Get formation energy of most stable structure from MP
-        with MPRester(self.mapi_key) if self.mapi_key else MPRester() as mpr:
-            struct_lst = mpr.get_data(comp.reduced_formula)
-            if len(struct_lst) > 0:
-                most_stable_entry = sorted(struct_lst, key=lambda e: e["energy_per_atom"])[0]
-                try:
-                    return [mpr.get_cohesive_energy(most_stable_entry["material_id"], per_atom=True)]
-                except Exception:
-                    raise ValueError(
-                        "No cohesive energy can be determined for material_id: {}".format(
-                            most_stable_entry["material_id"]
-                        )
-                    )
-            else:
-                raise ValueError(f"No structure found in MP for {comp}")
+        mpr = self._get_mprester()
+        struct_lst = mpr.get_data(comp.reduced_formula)
+        if len(struct_lst) > 0:
+            most_stable_entry = min(struct_lst, key=lambda e: e["energy_per_atom"])
+            try:
+                return [mpr.get_cohesive_energy(most_stable_entry["material_id"], per_atom=True)]
+            except Exception:
+                raise ValueError(
+                    "No cohesive energy can be determined for material_id: {}".format(most_stable_entry["material_id"])
+                )
+        else:
+            raise ValueError(f"No structure found in MP for {comp}")
 
     def feature_labels(self):
         return ["cohesive energy (MP)"]
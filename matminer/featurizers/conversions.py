@@ -8,6 +8,7 @@ transformation or as part of a Pipeline.
 """
 
 import json
+from functools import lru_cache
 
 from monty.json import MontyDecoder
 from pymatgen.core.composition import Composition
@@ -140,10 +141,7 @@ class StrToComposition(ConversionFeaturizer):
             (`pymatgen.core.composition.Composition`): A composition object.
         """
 
-        if self.reduce:
-            return [Composition(string_composition).reduced_composition]
-        else:
-            return [Composition(string_composition)]
+        return [_str_to_composition(string_composition, self.reduce)]
 
     def citations(self):
         return [
@@ -159,6 +157,23 @@ class StrToComposition(ConversionFeaturizer):
         return ["Anubhav Jain", "Alex Ganose"]
 
 
+@lru_cache(maxsize=4096)
+def _str_to_composition(string_composition, reduce=False):
+    """Parse a formula string into a Composition
+
+    Datasets often repeat the same formula many times, so the (immutable)
+    Composition objects are cached rather than re-parsed for every row.
+
+    Args:
+        string_composition (str): A chemical formula (e.g., "Fe2O3")
+        reduce (bool): Whether to return the reduced composition
+    Returns:
+        (Composition) parsed composition
+    """
+    comp = Composition(string_composition)
+    return comp.reduced_composition if reduce else comp
+
+
 class StructureToComposition(ConversionFeaturizer):
     """
     Utility featurizer to convert a Structure to a Composition.
@@ -90,7 +90,7 @@ class IntersticeDistribution(BaseFeaturizer):
         # Get center atom's radius and its nearest neighbors' radii
         center_r = self.data_source.get_elemental_properties([struct[idx].specie], self.radius_type)[0] / 100
         nn_els = [nn["site"].specie for nn in n_w]
-        nn_rs = np.array(self.data_source.get_elemental_properties(nn_els, self.radius_type)) / 100
+        nn_rs = self.data_source.get_elemental_properties(nn_els, self.radius_type) / 100
 
         # Get indices of atoms forming the simplices of convex hull
         convex_hull_simplices = ConvexHull(nn_coords).simplices
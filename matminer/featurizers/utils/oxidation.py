@@ -7,7 +7,4 @@ def has_oxidation_states(comp):
     Returns:
         (boolean) Whether this composition object contains oxidation states
     """
-    for el in comp.elements:
-        if not hasattr(el, "oxi_state") or el.oxi_state is None:
-            return False
-    return True
+    return all(getattr(el, "oxi_state", None) is not None for el in comp.elements)
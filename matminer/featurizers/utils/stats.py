@@ -27,8 +27,13 @@ class PropertyStats:
     You can, of course, call the statistical functions directly. All take at
     least two arguments.  The first is the data being assessed and the second,
     optional, argument is the weights.
+
+    The weighted statistics listed in ``PropertyStats.matrix_stats`` can also
+    be computed for many properties at once with ``calc_stats_matrix``.
     """
 
+    matrix_stats = frozenset(["minimum", "maximum", "range", "mean", "avg_dev", "std_dev", "mode"])
+
     @staticmethod
     def calc_stat(data_lst, stat, weights=None):
         """
@@ -46,6 +51,55 @@ class PropertyStats:
         statistics = stat.split("::")
         return getattr(PropertyStats, statistics[0])(data_lst, weights, *statistics[1:])
 
+    @staticmethod
+    def calc_stats_matrix(data, stats, weights):
+        """
+        Compute several weighted statistics for many properties at once
+
+        Gives the same results as calling ``calc_stat`` for each row of ``data``
+        and each statistic, but uses a single NumPy operation per statistic.
+        Only the statistics in ``PropertyStats.matrix_stats`` are supported.
+
+        Args:
+            data (2D array of floats): values of each property (rows) for each entry (columns)
+            stats (list of str): names of the statistics to compute
+            weights (list of floats): weights for each entry
+        Returns:
+            (2D array) value of each statistic (columns) for each property (rows)
+        """
+        data = np.asarray(data, dtype=np.float64)
+        weights = np.asarray(weights, dtype=np.float64)
+
+        mean = data @ weights / np.sum(weights)
+        diff = data - mean[:, None]
+
+        output = np.empty((len(data), len(stats)))
+        for i, stat in enumerate(stats):
+            if stat == "minimum":
+                output[:, i] = np.min(data, axis=1)
+            elif stat == "maximum":
+                output[:, i] = np.max(data, axis=1)
+            elif stat == "range":
+                output[:, i] = np.ptp(data, axis=1)
+            elif stat == "mean":
+                output[:, i] = mean
+            elif stat == "avg_dev":
+                output[:, i] = np.abs(diff) @ weights / np.sum(weights)
+            elif stat == "std_dev":
+                if data.shape[1] == 1:
+                    # Special case: Only one entry
+                    output[:, i] = 0
+                else:
+                    beta = np.sum(weights) / (np.sum(weights) ** 2 - np.sum(np.power(weights, 2)))
+                    output[:, i] = np.sqrt(beta * (diff**2 @ weights))
+            elif stat == "mode":
+                # Minimum of the entries with the largest weight
+                most_freq = np.isclose(weights, weights.max())
+                output[:, i] = np.min(data[:, most_freq], axis=1)
+            else:
+                raise ValueError(f"Statistic {stat} cannot be computed with calc_stats_matrix")
+        return output
+
     @staticmethod
     def minimum(data_lst, weights=None):
         """Minimum value in a list
@@ -56,7 +110,7 @@ class PropertyStats:
         Returns:
             minimum value
         """
-        return min(data_lst) if not np.any(np.isnan(data_lst)) else float("nan")
+        return np.min(data_lst)
 
     @staticmethod
     def maximum(data_lst, weights=None):
@@ -68,7 +122,7 @@ class PropertyStats:
         Returns:
             maximum value
         """
-        return max(data_lst) if not np.any(np.isnan(data_lst)) else float("nan")
+        return np.max(data_lst)
 
     @staticmethod
     def range(data_lst, weights=None):
@@ -80,7 +134,7 @@ class PropertyStats:
         Returns:
             range
         """
-        return (max(data_lst) - min(data_lst)) if not np.any(np.isnan(data_lst)) else float("nan")
+        return np.ptp(data_lst)
 
     @staticmethod
     def mean(data_lst, weights=None):
@@ -242,7 +296,9 @@ class PropertyStats:
             mode
         """
         if weights is None:
-            return scipy.stats.mode(data_lst, keepdims=True).mode[0]
+            # np.unique sorts the values, so argmax picks the smallest of the most common values
+            values, counts = np.unique(data_lst, return_counts=True)
+            return values[np.argmax(counts)]
         else:
             # Find the entry(s) with the largest weight
             data_lst = np.array(data_lst)
@@ -270,28 +326,37 @@ class PropertyStats:
             if power == -1:
                 return scipy.stats.hmean(data_lst)
             elif power == 0:
-                return scipy.stats.mstats.gmean(data_lst)
+                # Geometric mean, computed in log space. A zero gives log(0)=-inf and a mean of
+                #  zero, while NaN and negative values still propagate as NaN
+                data_lst = np.asarray(data_lst, dtype=np.float64)
+                with np.errstate(divide="ignore"):
+                    return np.exp(np.mean(np.log(data_lst)))
             else:
                 return np.power(np.mean(np.power(data_lst, power)), 1.0 / power)
         else:
+            data_lst = np.asarray(data_lst, dtype=np.float64)
+            weights = np.asarray(weights, dtype=np.float64)
+
             # Compute the normalization factor
-            alpha = sum(weights)
+            alpha = np.sum(weights)
 
             if power == -1:
-                denom = 0
-                for idx, x in enumerate(data_lst):
-                    denom += weights[idx] / x
-
-                return sum(weights) / denom
+                return alpha / np.dot(weights, 1.0 / data_lst)
 
-            # If power=0, return geometric mean
+            # If power=0, return geometric mean (computed in log space to avoid overflow)
             elif power == 0:
-                return np.product(np.power(data_lst, np.true_divide(weights, np.sum(weights))))
+                # Entries with zero weight do not contribute, and any other zero makes the mean zero
+                #  through log(0)=-inf
+                nonzero = weights != 0
+
+                # With a single contributing entry the mean is that entry, exactly
+                #  (round-off from the log/exp would make geom_std_dev infinite)
+                if np.count_nonzero(nonzero) == 1:
+                    return data_lst[nonzero][0]
+                with np.errstate(divide="ignore"):
+                    return np.exp(np.dot(weights[nonzero], np.log(data_lst[nonzero])) / alpha)
             else:
-                return np.power(
-                    np.sum(np.multiply(weights, np.power(data_lst, power))) / alpha,
-                    1.0 / power,
-                )
+                return np.power(np.dot(weights, np.power(data_lst, power)) / alpha, 1.0 / power)
 
     @staticmethod
     def sorted(data_lst, weights=None):
@@ -44,6 +44,10 @@ class TestPropertyStats(TestCase):
     def test_range(self):
         self._run_test("range", 0, 0, 1.5, 1.5)
 
+    def test_nan_propagation(self):
+        for stat in ["minimum", "maximum", "range"]:
+            self.assertTrue(np.isnan(PropertyStats.calc_stat([1, np.nan, 2], stat)))
+
     def test_mean(self):
         self._run_test("mean", 1, 1, 2.0 / 3, 5.0 / 7)
 
@@ -66,7 +70,28 @@ class TestPropertyStats(TestCase):
         self.assertAlmostEqual(0, PropertyStats.mode([0, 1, 2], [1, 1, 1]))
 
     def test_holder_mean(self):
-        self._run_test("holder_mean::0", 1, 1, np.product(self.sample_2), 0)
+        self._run_test("holder_mean::0", 1, 1, np.prod(self.sample_2), 0)
+
+        # A single entry is returned exactly, even if negative
+        self.assertEqual(PropertyStats.holder_mean([26], [1], power=0), 26)
+        self.assertEqual(PropertyStats.holder_mean([-1.5], [1], power=0), -1.5)
+        self.assertEqual(PropertyStats.holder_mean([3, 26], [0, 0.5], power=0), 26)
+
+        # Geometric mean of large values should not overflow
+        self.assertAlmostEqual(PropertyStats.holder_mean([1e200, 1e300], [1, 1], power=0) / 1e250, 1)
+        self.assertAlmostEqual(PropertyStats.holder_mean([1e200, 1e300], power=0) / 1e250, 1)
+
+        # Zeros give a geometric mean of zero, unless their weight is zero
+        with np.errstate(all="raise"):
+            self.assertEqual(PropertyStats.holder_mean([0, 2], power=0), 0)
+            self.assertEqual(PropertyStats.holder_mean([0, 2], [1, 1], power=0), 0)
+            self.assertAlmostEqual(PropertyStats.holder_mean([0, 2, 8], [0, 1, 1], power=0), 4)
+
+        # A zero does not hide NaN or negative values
+        with np.errstate(invalid="ignore"):
+            for data in ([0, np.nan], [0, -2]):
+                self.assertTrue(np.isnan(PropertyStats.holder_mean(data, power=0)))
+                self.assertTrue(np.isnan(PropertyStats.holder_mean(data, [1, 1], power=0)))
 
         self._run_test("holder_mean::1", 1, 1, 2.0 / 3, 5.0 / 7)
         self._run_test("holder_mean::2", 1, 1, sqrt(5.0 / 6), 0.88640526)
@@ -77,6 +102,25 @@ class TestPropertyStats(TestCase):
 
         self.assertAlmostEqual(PropertyStats.holder_mean([1, 2], [2, 1], power=-1), 1.2, places=3)
 
+    def test_mode_ties(self):
+        self.assertEqual(1, PropertyStats.mode([3, 1, 1, 3]))
+        self.assertEqual(2, PropertyStats.mode([1, 2, 2, 3]))
+        self.assertEqual(1, PropertyStats.mode([np.nan, 1, 1]))
+
+    def test_calc_stats_matrix(self):
+        stats = ["minimum", "maximum", "range", "mean", "avg_dev", "std_dev", "mode"]
+        data = [self.sample_2, [2, np.nan, 1], [3, 3, 1]]
+        result = PropertyStats.calc_stats_matrix(data, stats, self.sample_2_weights)
+        expected = [[PropertyStats.calc_stat(row, s, self.sample_2_weights) for s in stats] for row in data]
+        np.testing.assert_array_almost_equal(expected, result)
+
+        # Only one entry
+        result = PropertyStats.calc_stats_matrix([[1], [2]], stats, [1])
+        np.testing.assert_array_almost_equal([[1, 1, 0, 1, 0, 0, 1], [2, 2, 0, 2, 0, 0, 2]], result)
+
+        with self.assertRaises(ValueError):
+            PropertyStats.calc_stats_matrix(data, ["kurtosis"], self.sample_2_weights)
+
     def test_geom_std_dev(self):
         # This is right. Yes, a list without variation has a geom_std_dev of 1
         self.assertAlmostEqual(1, PropertyStats.geom_std_dev([1, 1, 1]))
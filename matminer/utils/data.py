@@ -6,10 +6,12 @@ including ``pymatgen`` and ``Magpie``.
 
 import abc
 import json
+import numbers
 import os
 import tarfile
 import warnings
 from copy import deepcopy
+from functools import lru_cache
 from glob import glob
 
 import numpy as np
@@ -52,9 +54,14 @@ class AbstractData(metaclass=abc.ABCMeta):
             elems - ([Element]) list of elements
             property_name - (str) property to be retrieved
         Returns:
-            [float], properties of elements
+            (np.ndarray) properties of elements, in the same order as `elems`. Properties that
+                are not real numbers (e.g., lists of oxidation states, names or booleans) are
+                returned as a list instead
         """
-        return [self.get_elemental_property(e, property_name) for e in elems]
+        props = [self.get_elemental_property(e, property_name) for e in elems]
+        if all(isinstance(p, numbers.Real) and not isinstance(p, bool) for p in props):
+            return np.array(props, dtype=np.float64)
+        return props
 
 
 class OxidationStatesMixin(metaclass=abc.ABCMeta):
@@ -272,27 +279,15 @@ class MagpieData(AbstractData, OxidationStatesMixin):
 
     def __init__(self, impute_nan=False):
         self.all_elemental_props = dict()
-        available_props = []
         self.data_dir = os.path.join(module_dir, "data_files", "magpie_elementdata")
 
-        # Make a list of available properties
-        for datafile in glob(os.path.join(self.data_dir, "*.table")):
-            available_props.append(os.path.basename(datafile).replace(".table", ""))
-
-        # parse and store elemental properties
-        for descriptor_name in available_props:
-            with open(os.path.join(self.data_dir, f"{descriptor_name}.table")) as f:
-                self.all_elemental_props[descriptor_name] = dict()
-                lines = f.readlines()
-                for atomic_no in range(1, 118 + 1):  # (max Z=118)
-                    try:
-                        if descriptor_name in ["OxidationStates"]:
-                            prop_value = [float(i) for i in lines[atomic_no - 1].split()]
-                        else:
-                            prop_value = float(lines[atomic_no - 1])
-                    except (ValueError, IndexError):
-                        prop_value = float("NaN")
-                    self.all_elemental_props[descriptor_name][Element.from_Z(atomic_no).symbol] = prop_value
+        # parse and store elemental properties. The parsed tables are shared
+        #  between instances, so copy them before any imputation is applied
+        for descriptor_name in sorted(_get_magpie_table_names(self.data_dir)):
+            table = _read_magpie_table(self.data_dir, descriptor_name)
+            self.all_elemental_props[descriptor_name] = {
+                el: list(value) if isinstance(value, list) else value for el, value in table.items()
+            }
 
         self.impute_nan = impute_nan
         if self.impute_nan:
@@ -332,6 +327,47 @@ class MagpieData(AbstractData, OxidationStatesMixin):
         return self.all_elemental_props["OxidationStates"][elem.symbol]
 
 
+@lru_cache(maxsize=None)
+def _get_magpie_table_names(data_dir):
+    """Get the names of the properties available as Magpie ``.table`` files
+
+    Args:
+        data_dir (str): directory containing the Magpie tables
+    Returns:
+        (frozenset of str) names of the available properties
+    """
+    return frozenset(os.path.basename(f).replace(".table", "") for f in glob(os.path.join(data_dir, "*.table")))
+
+
+@lru_cache(maxsize=None)
+def _read_magpie_table(data_dir, descriptor_name):
+    """Parse a Magpie ``.table`` file into a dict of elemental properties
+
+    The result is cached, so each table is only read from disk once per session.
+    Callers must not modify the returned dict.
+
+    Args:
+        data_dir (str): directory containing the Magpie tables
+        descriptor_name (str): name of the property (i.e., the table file name)
+    Returns:
+        ({str: float or [float]}) property value for each element symbol
+    """
+    with open(os.path.join(data_dir, f"{descriptor_name}.table")) as f:
+        lines = f.readlines()
+
+    table = {}
+    for atomic_no in range(1, 118 + 1):  # (max Z=118)
+        try:
+            if descriptor_name in ["OxidationStates"]:
+                prop_value = [float(i) for i in lines[atomic_no - 1].split()]
+            else:
+                prop_value = float(lines[atomic_no - 1])
+        except (ValueError, IndexError):
+            prop_value = float("NaN")
+        table[Element.from_Z(atomic_no).symbol] = prop_value
+    return table
+
+
 class PymatgenData(OxidationStateDependentData, OxidationStatesMixin):
     """
     Class to get data from pymatgen. See also:
@@ -1,6 +1,6 @@
 def flatten_dict(nested_dict, lead_key=None, unwind_arrays=True):
     """
-    Helper function to flatten nested dictionary, recursively
+    Helper function to flatten nested dictionary, iteratively
     walks through nested dictionary to get keys corresponding
     to dot-notation keys, e. g. converts
     {"a": {"b": 1, "c": 2}} to {"a.b": 1, "a.c": 2}
@@ -9,24 +9,32 @@ def flatten_dict(nested_dict, lead_key=None, unwind_arrays=True):
         nested_dict ({}): nested dictionary to flatten
         unwind_arrays (bool): whether to flatten lists/tuples
             with numerically indexed dot notation, defaults to True
-        lead_key (str): string to append to front of all keys,
-            used primarily for recursion
+        lead_key (str): string to append to front of all keys
 
     Returns:
         non-nested dictionary
     """
     flattened = {}
 
-    for key, value in nested_dict.items():
-        flat_key = f"{lead_key}.{key}" if lead_key else key
+    # Walk the nested structure with an explicit stack of item iterators
+    #  rather than recursion, which keeps the original key order and avoids
+    #  building intermediate dictionaries for each level
+    stack = [(lead_key, iter(nested_dict.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            flat_key = f"{prefix}.{key}" if prefix else key
 
-        if isinstance(value, dict):
-            flattened.update(flatten_dict(value, flat_key, unwind_arrays))
+            if isinstance(value, dict):
+                stack.append((flat_key, iter(value.items())))
+                break
 
-        elif isinstance(value, (list, tuple)) and unwind_arrays:
-            array_dict = {n: elt for n, elt in enumerate(value)}
-            flattened.update(flatten_dict(array_dict, flat_key, unwind_arrays))
+            elif isinstance(value, (list, tuple)) and unwind_arrays:
+                stack.append((flat_key, enumerate(value)))
+                break
 
+            else:
+                flattened[flat_key] = value
         else:
-            flattened.update({flat_key: value})
+            stack.pop()
     return flattened
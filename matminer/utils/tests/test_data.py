@@ -2,6 +2,7 @@ import unittest
 from math import isnan
 from unittest import TestCase
 
+import numpy as np
 import pytest
 from pymatgen.core import Element
 from pymatgen.core.periodic_table import Specie
@@ -125,6 +126,19 @@ class TestMagpieData(TestCase):
         )
         self.assertTrue(isnan(self.data_source.get_elemental_property(Element("Og"), "AtomicWeight")))
 
+        weights = self.data_source.get_elemental_properties([Element("Be"), Element("Og")], "AtomicWeight")
+        self.assertIsInstance(weights, np.ndarray)
+        self.assertAlmostEqual(9.012182, weights[0])
+        self.assertTrue(isnan(weights[1]))
+
+        # Sequence-valued properties are kept as one entry per element, even if of equal length
+        ox_states = self.data_source.get_elemental_properties([Element("C"), Element("O")], "OxidationStates")
+        self.assertEqual(2, len(ox_states))
+        self.assertEqual([-4, 2, 4], list(ox_states[0]))
+        ox_states = self.data_source.get_elemental_properties([Element("C"), Element("C")], "OxidationStates")
+        self.assertEqual(2, len(ox_states))
+        self.assertEqual([-4, 2, 4], list(ox_states[1]))
+
         self.assertAlmostEqual(
             9.012182,
             self.data_source_imputed.get_elemental_property(Element("Be"), "AtomicWeight"),
@@ -162,6 +176,17 @@ class TestPymatgenData(TestCase):
         with pytest.raises(IndexError):
             self.data_source.get_charge_dependent_property(Element("Og"), 0, "icsd_oxidation_states")
 
+        # Properties that are not real numbers are returned unchanged
+        elems = [Element("Fe"), Element("O")]
+        self.assertEqual(
+            [{2: 0.92, 3: 0.785}, {-2: 1.26}], self.data_source.get_elemental_properties(elems, "ionic_radii")
+        )
+        self.assertEqual(["Fe", "O"], self.data_source.get_elemental_properties(elems, "name"))
+        self.assertEqual([True, False], self.data_source.get_elemental_properties(elems, "is_metal"))
+        masses = self.data_source.get_elemental_properties(elems, "atomic_mass")
+        self.assertIsInstance(masses, np.ndarray)
+        self.assertAlmostEqual(15.9994, masses[1])
+
         self.assertAlmostEqual(
             9.012182,
             self.data_source_imputed.get_elemental_property(Element("Be"), "atomic_mass"),
@@ -24,6 +24,15 @@ class FlattenDictTest(unittest.TestCase):
         flattened = flatten_dict(test2, unwind_arrays=False)
         self.assertEqual(flattened["a.b"], (0, 1, 2))
 
+        # test key order and nesting deeper than the recursion limit
+        test3 = {"x": 0, "a": [{"b": 1}, 2], "c": {"d": {}, "e": 3}}
+        self.assertEqual(list(flatten_dict(test3)), ["x", "a.0.b", "a.1", "c.e"])
+
+        very_deep = 1
+        for _ in range(5000):
+            very_deep = {"a": very_deep}
+        self.assertEqual(list(flatten_dict(very_deep).values()), [1])
+
 
 if __name__ == "__main__":
     unittest.main()